@@ -2,7 +2,7 @@ import anthropic
 import json
 import logging
 import time
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
 from config import Config
 
 logging.basicConfig(level=logging.INFO)
@@ -36,7 +36,35 @@ class ClaudeClient:
                     time.sleep(2 ** attempt)  # Exponential backoff
                 else:
                     raise
-        
+
+    def _stream_api_call(self, messages, system_prompt=None, max_tokens=1000, temperature=0.1, retries=3):
+        """Stream API call text deltas, retrying only until the first chunk is delivered"""
+        kwargs = {
+            "model": self.model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "messages": messages
+        }
+
+        if system_prompt:
+            kwargs["system"] = system_prompt
+
+        for attempt in range(retries):
+            started = False
+            try:
+                with self.client.messages.stream(**kwargs) as stream:
+                    for text in stream.text_stream:
+                        started = True
+                        yield text
+                return
+
+            except Exception as e:
+                logger.error(f"Streaming API call failed (attempt {attempt + 1}/{retries}): {e}")
+                # Retrying after text was yielded would duplicate output downstream
+                if started or attempt >= retries - 1:
+                    raise
+                time.sleep(2 ** attempt)  # Exponential backoff
+
     def generate_sql_query(self, user_query: str, table_schema: List[Dict[str, Any]]) -> str:
         """Generate SQL query from natural language using Claude with simplified columns"""
         
@@ -114,41 +142,45 @@ class ClaudeClient:
             logger.error(f"Error generating SQL query: {e}")
             return ""
     
+    def _analyze_data_request(self, user_query: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the Claude request for data analysis"""
+        # Convert data to readable format
+        if isinstance(data, dict) and 'data' in data:
+            df_data = data['data']
+            if hasattr(df_data, 'to_dict'):
+                data_str = df_data.to_dict('records')
+            else:
+                data_str = str(df_data)
+        else:
+            data_str = str(data)
+        
+        system_prompt = """You are an expert Amazon PPC analyst. Analyze the provided keyword performance data and provide actionable insights.
+
+        Focus on:
+        1. Performance trends and patterns
+        2. Opportunities for optimization
+        3. Underperforming keywords that need attention
+        4. Recommendations for budget allocation
+        5. Seasonal or temporal patterns
+        
+        Provide clear, actionable insights in a business-friendly format.
+        """
+        
+        return {
+            "messages": [{
+                "role": "user",
+                "content": f"User Question: {user_query}\n\nData: {data_str}\n\nPlease analyze this data and provide insights."
+            }],
+            "system_prompt": system_prompt,
+            "max_tokens": 2000,
+            "temperature": 0.3
+        }
+    
     def analyze_data(self, user_query: str, data: Dict[str, Any]) -> str:
         """Analyze data and provide insights using Claude"""
         
         try:
-            # Convert data to readable format
-            if isinstance(data, dict) and 'data' in data:
-                df_data = data['data']
-                if hasattr(df_data, 'to_dict'):
-                    data_str = df_data.to_dict('records')
-                else:
-                    data_str = str(df_data)
-            else:
-                data_str = str(data)
-            
-            system_prompt = """You are an expert Amazon PPC analyst. Analyze the provided keyword performance data and provide actionable insights.
-
-            Focus on:
-            1. Performance trends and patterns
-            2. Opportunities for optimization
-            3. Underperforming keywords that need attention
-            4. Recommendations for budget allocation
-            5. Seasonal or temporal patterns
-            
-            Provide clear, actionable insights in a business-friendly format.
-            """
-            
-            response = self._make_api_call(
-                messages=[{
-                    "role": "user",
-                    "content": f"User Question: {user_query}\n\nData: {data_str}\n\nPlease analyze this data and provide insights."
-                }],
-                system_prompt=system_prompt,
-                max_tokens=2000,
-                temperature=0.3
-            )
+            response = self._make_api_call(**self._analyze_data_request(user_query, data))
             
             if response and hasattr(response, 'content') and response.content:
                 return response.content[0].text
@@ -160,33 +192,41 @@ class ClaudeClient:
             logger.error(f"Error analyzing data: {e}")
             return f"Sorry, I encountered an error while analyzing the data: {str(e)}"
     
+    def stream_analyze_data(self, user_query: str, data: Dict[str, Any]) -> Iterator[str]:
+        """Streaming variant of analyze_data that yields text chunks as they arrive"""
+        yield from self._stream_api_call(**self._analyze_data_request(user_query, data))
+    
+    def _insights_request(self, query_results: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the Claude request for insight generation"""
+        system_prompt = """You are a data analyst specializing in Amazon keyword performance. 
+        Analyze the provided data and generate actionable business insights.
+        
+        Focus on:
+        - Key performance indicators
+        - Trends and patterns
+        - Optimization opportunities
+        - Recommendations for improvement
+        
+        Provide insights in a clear, structured format.
+        """
+        
+        data_summary = str(query_results)
+        
+        return {
+            "messages": [{
+                "role": "user",
+                "content": f"Please analyze this keyword performance data and provide insights:\n\n{data_summary}"
+            }],
+            "system_prompt": system_prompt,
+            "max_tokens": 1500,
+            "temperature": 0.2
+        }
+    
     def generate_insights(self, query_results: Dict[str, Any]) -> str:
         """Generate insights from query results"""
         
         try:
-            system_prompt = """You are a data analyst specializing in Amazon keyword performance. 
-            Analyze the provided data and generate actionable business insights.
-            
-            Focus on:
-            - Key performance indicators
-            - Trends and patterns
-            - Optimization opportunities
-            - Recommendations for improvement
-            
-            Provide insights in a clear, structured format.
-            """
-            
-            data_summary = str(query_results)
-            
-            response = self._make_api_call(
-                messages=[{
-                    "role": "user",
-                    "content": f"Please analyze this keyword performance data and provide insights:\n\n{data_summary}"
-                }],
-                system_prompt=system_prompt,
-                max_tokens=1500,
-                temperature=0.2
-            )
+            response = self._make_api_call(**self._insights_request(query_results))
             
             if response and hasattr(response, 'content') and response.content:
                 return response.content[0].text
@@ -198,6 +238,10 @@ class ClaudeClient:
             logger.error(f"Error generating insights: {e}")
             return "Unable to generate insights at this time."
     
+    def stream_insights(self, query_results: Dict[str, Any]) -> Iterator[str]:
+        """Streaming variant of generate_insights that yields text chunks as they arrive"""
+        yield from self._stream_api_call(**self._insights_request(query_results))
+    
     def understand_query_intent(self, user_query: str) -> Dict[str, Any]:
         """Understand the intent and type of query"""
         
@@ -260,42 +304,46 @@ class ClaudeClient:
                 "requires_sql": True
             }
     
+    def _simple_response_request(self, user_query: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the Claude request for a simple mode answer"""
+        # Convert data to readable format
+        if isinstance(data, dict) and 'data' in data:
+            df_data = data['data']
+            if hasattr(df_data, 'to_dict'):
+                data_str = df_data.to_dict('records')
+            else:
+                data_str = str(df_data)
+        else:
+            data_str = str(data)
+        
+        system_prompt = """You are an expert Amazon PPC analyst. Provide simple, direct answers to questions about keyword performance data.
+
+        Guidelines for simple mode:
+        1. Keep responses concise (1-3 sentences maximum)
+        2. Focus on the most important information
+        3. Use simple language
+        4. Provide yes/no answers when possible
+        5. Include key numbers/percentages if relevant
+        6. Avoid lengthy explanations or recommendations
+        
+        Format: Direct answer with key data points if available.
+        """
+        
+        return {
+            "messages": [{
+                "role": "user",
+                "content": f"Question: {user_query}\n\nData: {data_str}\n\nProvide a simple, direct answer."
+            }],
+            "system_prompt": system_prompt,
+            "max_tokens": 300,  # Shorter for simple mode
+            "temperature": 0.1
+        }
+    
     def generate_simple_response(self, user_query: str, data: Dict[str, Any]) -> str:
         """Generate a simple, concise response for simple mode"""
         
         try:
-            # Convert data to readable format
-            if isinstance(data, dict) and 'data' in data:
-                df_data = data['data']
-                if hasattr(df_data, 'to_dict'):
-                    data_str = df_data.to_dict('records')
-                else:
-                    data_str = str(df_data)
-            else:
-                data_str = str(data)
-            
-            system_prompt = """You are an expert Amazon PPC analyst. Provide simple, direct answers to questions about keyword performance data.
-
-            Guidelines for simple mode:
-            1. Keep responses concise (1-3 sentences maximum)
-            2. Focus on the most important information
-            3. Use simple language
-            4. Provide yes/no answers when possible
-            5. Include key numbers/percentages if relevant
-            6. Avoid lengthy explanations or recommendations
-            
-            Format: Direct answer with key data points if available.
-            """
-            
-            response = self._make_api_call(
-                messages=[{
-                    "role": "user",
-                    "content": f"Question: {user_query}\n\nData: {data_str}\n\nProvide a simple, direct answer."
-                }],
-                system_prompt=system_prompt,
-                max_tokens=300,  # Shorter for simple mode
-                temperature=0.1
-            )
+            response = self._make_api_call(**self._simple_response_request(user_query, data))
             
             if response and hasattr(response, 'content') and response.content:
                 return response.content[0].text.strip()
@@ -307,6 +355,10 @@ class ClaudeClient:
             logger.error(f"Error generating simple response: {e}")
             return "I found some data but couldn't provide a simple answer."
     
+    def stream_simple_response(self, user_query: str, data: Dict[str, Any]) -> Iterator[str]:
+        """Streaming variant of generate_simple_response that yields text chunks as they arrive"""
+        yield from self._stream_api_call(**self._simple_response_request(user_query, data))
+    
     def translate_text(self, text: str, target_language: str) -> str:
         """Translate text to the target language using Claude AI"""
         
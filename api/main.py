@@ -1,8 +1,11 @@
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, HTTPException, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
+import json
 import logging
+import threading
 import traceback
 import time
 import os
@@ -118,26 +121,37 @@ class QueryIntent(BaseModel):
 snowflake_client = None
 claude_client = None
 
+# Endpoints run in FastAPI's worker threadpool, so guard lazy client creation
+_client_lock = threading.Lock()
+
 def get_snowflake_client():
     global snowflake_client
     if snowflake_client is None:
-        try:
-            snowflake_client = SnowflakeClient()
-        except Exception as e:
-            logger.error(f"Failed to initialize Snowflake client: {e}")
-            raise
+        with _client_lock:
+            if snowflake_client is None:
+                try:
+                    snowflake_client = SnowflakeClient()
+                except Exception as e:
+                    logger.error(f"Failed to initialize Snowflake client: {e}")
+                    raise
     return snowflake_client
 
 def get_claude_client():
     global claude_client
     if claude_client is None:
-        try:
-            claude_client = ClaudeClient()
-        except Exception as e:
-            logger.error(f"Failed to initialize Claude client: {e}")
-            raise
+        with _client_lock:
+            if claude_client is None:
+                try:
+                    claude_client = ClaudeClient()
+                except Exception as e:
+                    logger.error(f"Failed to initialize Claude client: {e}")
+                    raise
     return claude_client
 
+# Endpoints that call the blocking Snowflake/Claude clients are plain ``def``
+# handlers: FastAPI runs those in its threadpool, so a long chat or translation
+# no longer stalls the event loop (and every other request) while it waits.
+
 @app.get("/")
 async def root():
     """Health check endpoint"""
@@ -148,7 +162,7 @@ async def root():
     }
 
 @app.get("/health")
-async def health_check():
+def health_check():
     """Detailed health check"""
     try:
         health_status = {
@@ -187,129 +201,197 @@ async def health_check():
             "error": str(e)
         }
 
-@app.post("/chat", response_model=ChatResponse)
-async def chat(request: ChatRequest):
-    """Main chat endpoint for keyword performance analysis"""
+def _chat_events(user_message: str, mode: str, stream: bool = False) -> Iterator[Dict[str, Any]]:
+    """Run the chat pipeline, yielding stage/token events and finally the result.
+
+    Events are dicts with a ``type`` of ``stage`` (pipeline progress), ``token``
+    (response text delta, only when ``stream`` is set) or ``result`` (the final
+    ChatResponse under ``response``).
+    """
+    if not user_message:
+        yield {"type": "result", "response": ChatResponse(
+            response="Please provide a message to analyze.",
+            error="Empty message"
+        )}
+        return
+    
+    # Get clients with error handling
     try:
-        user_message = request.message.strip()
-        mode = request.mode or "research"
-        
-        if not user_message:
-            return ChatResponse(
-                response="Please provide a message to analyze.",
-                error="Empty message"
-            )
-        
-        # Get clients with error handling
-        try:
-            sf_client = get_snowflake_client()
-        except Exception as e:
-            return ChatResponse(
-                response="I'm having trouble connecting to the database. Please check your Snowflake configuration.",
-                error=f"Snowflake connection error: {str(e)}"
-            )
-        
-        try:
-            claude = get_claude_client()
-        except Exception as e:
-            return ChatResponse(
-                response="I'm having trouble connecting to the AI service. Please check your Claude API configuration.",
-                error=f"Claude connection error: {str(e)}"
-            )
-        
-        # Step 1: Understand query intent
-        try:
-            intent_analysis = claude.understand_query_intent(user_message)
-            logger.info(f"Query intent: {intent_analysis}")
-        except Exception as e:
-            logger.error(f"Error understanding query intent: {e}")
-            intent_analysis = {
-                "intent": "PERFORMANCE_ANALYSIS",
-                "confidence": 0.5,
-                "entities": [],
-                "requires_sql": True
-            }
-        
-        # Step 2: Get table schema for SQL generation
+        sf_client = get_snowflake_client()
+    except Exception as e:
+        yield {"type": "result", "response": ChatResponse(
+            response="I'm having trouble connecting to the database. Please check your Snowflake configuration.",
+            error=f"Snowflake connection error: {str(e)}"
+        )}
+        return
+    
+    try:
+        claude = get_claude_client()
+    except Exception as e:
+        yield {"type": "result", "response": ChatResponse(
+            response="I'm having trouble connecting to the AI service. Please check your Claude API configuration.",
+            error=f"Claude connection error: {str(e)}"
+        )}
+        return
+    
+    # Step 1: Understand query intent
+    yield {"type": "stage", "label": "🔍 Analyzing your question..."}
+    try:
+        intent_analysis = claude.understand_query_intent(user_message)
+        logger.info(f"Query intent: {intent_analysis}")
+    except Exception as e:
+        logger.error(f"Error understanding query intent: {e}")
+        intent_analysis = {
+            "intent": "PERFORMANCE_ANALYSIS",
+            "confidence": 0.5,
+            "entities": [],
+            "requires_sql": True
+        }
+    
+    # Step 2: Get table schema for SQL generation
+    try:
+        table_schema = sf_client.get_table_schema(Config.KEYWORD_TABLE)
+        if not table_schema:
+            yield {"type": "result", "response": ChatResponse(
+                response=f"I couldn't find the table schema for {Config.KEYWORD_TABLE}. Please check your table configuration.",
+                error="Table schema not found"
+            )}
+            return
+    except Exception as e:
+        yield {"type": "result", "response": ChatResponse(
+            response=f"I couldn't access the table schema: {str(e)}",
+            error=f"Schema error: {str(e)}"
+        )}
+        return
+    
+    # Step 3: Generate SQL query if needed
+    sql_query = None
+    data = None
+    data_dict = None
+    
+    if intent_analysis.get("requires_sql", True):
         try:
-            table_schema = sf_client.get_table_schema(Config.KEYWORD_TABLE)
-            if not table_schema:
-                return ChatResponse(
-                    response=f"I couldn't find the table schema for {Config.KEYWORD_TABLE}. Please check your table configuration.",
-                    error="Table schema not found"
-                )
+            sql_query = claude.generate_sql_query(user_message, table_schema)
+            logger.info(f"Generated SQL: {sql_query}")
         except Exception as e:
-            return ChatResponse(
-                response=f"I couldn't access the table schema: {str(e)}",
-                error=f"Schema error: {str(e)}"
-            )
-        
-        # Step 3: Generate SQL query if needed
-        sql_query = None
-        data = None
-        data_dict = None
+            logger.error(f"Error generating SQL: {e}")
+            yield {"type": "result", "response": ChatResponse(
+                response="I had trouble converting your question to a database query. Please try rephrasing your question.",
+                error=f"SQL generation error: {str(e)}"
+            )}
+            return
         
-        if intent_analysis.get("requires_sql", True):
+        if sql_query:
+            # Step 4: Execute SQL query
+            yield {"type": "stage", "label": "📊 Querying the database..."}
             try:
-                sql_query = claude.generate_sql_query(user_message, table_schema)
-                logger.info(f"Generated SQL: {sql_query}")
-                
-                if sql_query:
-                    # Step 4: Execute SQL query
-                    try:
-                        data = sf_client.execute_query(sql_query)
-                        data_dict = data.to_dict('records') if not data.empty else []
-                        logger.info(f"Query executed successfully, returned {len(data_dict)} rows")
-                    except Exception as e:
-                        logger.error(f"SQL execution error: {e}")
-                        return ChatResponse(
-                            response=f"I generated a SQL query but encountered an error executing it: {str(e)}",
-                            sql_query=sql_query,
-                            error=str(e)
-                        )
-                else:
-                    logger.warning("No SQL query generated")
-                    
+                data = sf_client.execute_query(sql_query)
+                data_dict = data.to_dict('records') if not data.empty else []
+                logger.info(f"Query executed successfully, returned {len(data_dict)} rows")
             except Exception as e:
-                logger.error(f"Error generating SQL: {e}")
-                return ChatResponse(
-                    response="I had trouble converting your question to a database query. Please try rephrasing your question.",
-                    error=f"SQL generation error: {str(e)}"
-                )
-        
-        # Step 5: Generate insights and response based on mode
-        try:
-            if data is not None and not data.empty:
-                if mode == "simple":
-                    # Simple mode: Quick, concise response
-                    response = claude.generate_simple_response(user_message, {"data": data_dict})
-                    insights = None  # No detailed insights in simple mode
-                else:
-                    # Research mode: Detailed analysis
-                    insights = claude.analyze_data(user_message, {"data": data_dict})
-                    response = claude.generate_insights({"data": data_dict, "query": user_message})
-            else:
-                # Handle non-SQL queries (general questions, help, etc.)
-                if mode == "simple":
-                    response = claude.generate_simple_response(user_message, {"message": user_message})
-                    insights = None
-                else:
-                    response = claude.analyze_data(user_message, {"message": user_message})
-                    insights = None
-        except Exception as e:
-            logger.error(f"Error generating insights: {e}")
+                logger.error(f"SQL execution error: {e}")
+                yield {"type": "result", "response": ChatResponse(
+                    response=f"I generated a SQL query but encountered an error executing it: {str(e)}",
+                    sql_query=sql_query,
+                    error=str(e)
+                )}
+                return
+        else:
+            logger.warning("No SQL query generated")
+    
+    # Step 5: Generate insights and response based on mode
+    yield {"type": "stage", "label": "🤖 Generating AI insights..."}
+    has_data = data is not None and not data.empty
+    context = {"data": data_dict} if has_data else {"message": user_message}
+    insights = None
+    try:
+        if stream:
             if mode == "simple":
-                response = "I found some data but couldn't provide a simple answer. Please try research mode for more details."
+                chunks = claude.stream_simple_response(user_message, context)
+            elif has_data:
+                chunks = claude.stream_insights({"data": data_dict, "query": user_message})
             else:
-                response = "I analyzed your data but had trouble generating insights. Here's what I found in the data."
-            insights = None
+                chunks = claude.stream_analyze_data(user_message, context)
+            
+            parts = []
+            for chunk in chunks:
+                parts.append(chunk)
+                yield {"type": "token", "text": chunk}
+            response = "".join(parts).strip()
+        elif mode == "simple":
+            # Simple mode: Quick, concise response
+            response = claude.generate_simple_response(user_message, context)
+        elif has_data:
+            # Research mode: Detailed analysis
+            insights = claude.analyze_data(user_message, context)
+            response = claude.generate_insights({"data": data_dict, "query": user_message})
+        else:
+            # Handle non-SQL queries (general questions, help, etc.)
+            response = claude.analyze_data(user_message, context)
         
-        return ChatResponse(
-            response=response,
-            data=data_dict,
-            sql_query=sql_query,
-            insights=insights
+        # When streaming, the response text goes out first and the detailed
+        # analysis follows so the user is not kept waiting on both
+        if stream and mode != "simple" and has_data:
+            yield {"type": "stage", "label": "📈 Finalizing response..."}
+            insights = claude.analyze_data(user_message, context)
+    except Exception as e:
+        logger.error(f"Error generating insights: {e}")
+        if mode == "simple":
+            response = "I found some data but couldn't provide a simple answer. Please try research mode for more details."
+        else:
+            response = "I analyzed your data but had trouble generating insights. Here's what I found in the data."
+        insights = None
+    
+    yield {"type": "result", "response": ChatResponse(
+        response=response,
+        data=data_dict,
+        sql_query=sql_query,
+        insights=insights
+    )}
+
+def _sse_frame(event: Dict[str, Any]) -> str:
+    """Serialize a chat event as a Server-Sent Events ``data:`` frame"""
+    return f"data: {json.dumps(event, default=str)}\n\n"
+
+def _stream_chat(user_message: str, mode: str) -> Iterator[str]:
+    """Drive the chat pipeline and emit it as SSE frames"""
+    try:
+        for event in _chat_events(user_message, mode, stream=True):
+            if event["type"] == "result":
+                yield _sse_frame({"type": "done", **event["response"].model_dump(mode="json")})
+            else:
+                yield _sse_frame(event)
+    except Exception as e:
+        logger.error(f"Chat stream error: {e}")
+        logger.error(traceback.format_exc())
+        yield _sse_frame({
+            "type": "done",
+            "response": "I'm sorry, I encountered an unexpected error while processing your request. Please try again.",
+            "error": str(e)
+        })
+
+@app.post("/chat", response_model=ChatResponse)
+def chat(request: ChatRequest, http_request: Request):
+    """Main chat endpoint for keyword performance analysis.
+
+    Clients sending ``Accept: text/event-stream`` receive pipeline stages and
+    response tokens as Server-Sent Events, ending with a ``done`` event that
+    carries the full ChatResponse payload.
+    """
+    user_message = request.message.strip()
+    mode = request.mode or "research"
+    
+    if "text/event-stream" in http_request.headers.get("accept", ""):
+        return StreamingResponse(
+            _stream_chat(user_message, mode),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
         )
+    
+    try:
+        for event in _chat_events(user_message, mode):
+            if event["type"] == "result":
+                return event["response"]
         
     except Exception as e:
         logger.error(f"Chat error: {e}")
@@ -320,7 +402,7 @@ async def chat(request: ChatRequest):
         )
 
 @app.get("/keywords/search/{search_term}")
-async def search_keywords(search_term: str):
+def search_keywords(search_term: str):
     """Search for keywords containing the search term"""
     try:
         sf_client = get_snowflake_client()
@@ -335,7 +417,7 @@ async def search_keywords(search_term: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/keywords/top/{metric}")
-async def get_top_keywords(metric: str = "purchases", limit: int = 10):
+def get_top_keywords(metric: str = "purchases", limit: int = 10):
     """Get top performing keywords by metric"""
     try:
         sf_client = get_snowflake_client()
@@ -350,7 +432,7 @@ async def get_top_keywords(metric: str = "purchases", limit: int = 10):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/summary")
-async def get_performance_summary():
+def get_performance_summary():
     """Get overall performance summary"""
     try:
         sf_client = get_snowflake_client()
@@ -360,8 +442,32 @@ async def get_performance_summary():
         logger.error(f"Summary error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/bootstrap")
+def bootstrap(metric: str = "purchases", limit: int = 10):
+    """Health, performance summary and top keywords in a single round trip"""
+    health = health_check()
+    
+    top_keywords = None
+    try:
+        sf_client = get_snowflake_client()
+        results = sf_client.get_top_performing_keywords(limit=limit, metric=metric)
+        top_keywords = {
+            "metric": metric,
+            "limit": limit,
+            "results": results.to_dict('records') if not results.empty else []
+        }
+    except Exception as e:
+        logger.error(f"Bootstrap top keywords error: {e}")
+    
+    return {
+        "health": health,
+        # The health check already queried the summary; reuse it
+        "summary": health.get("data_summary"),
+        "top_keywords": top_keywords
+    }
+
 @app.get("/schema")
-async def get_table_schema():
+def get_table_schema():
     """Get the table schema"""
     try:
         sf_client = get_snowflake_client()
@@ -375,7 +481,7 @@ async def get_table_schema():
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/translate", response_model=TranslationResponse)
-async def translate_text(request: TranslationRequest):
+def translate_text(request: TranslationRequest):
     """Translate text to Korean using Claude AI"""
     try:
         text = request.text.strip()
@@ -1,14 +1,16 @@
 import streamlit as st
 import requests
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta
-import json
+import orjson
 import os
+import hashlib
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from queue import Queue
+from collections import OrderedDict
 
 # Configuration - supports both local and deployed environments
 def get_api_base_url():
@@ -27,6 +29,65 @@ def get_api_base_url():
 
 API_BASE_URL = get_api_base_url()
 
+# Connect timeout for every API call; read timeouts are set per endpoint
+CONNECT_TIMEOUT = 3
+
+# Minimum seconds between health checks within one browser session
+HEALTH_CHECK_INTERVAL = 30
+
+# Number of Korean translations kept in the shared translation store
+TRANSLATION_STORE_SIZE = 256
+
+# Identical prompts submitted within this many seconds are treated as duplicates
+DUPLICATE_PROMPT_WINDOW = 2
+
+@st.cache_resource(show_spinner=False)
+def get_session():
+    """Shared HTTP session so API calls reuse pooled keep-alive connections.
+
+    Held with st.cache_resource so it survives reruns (which re-execute this
+    script) instead of being rebuilt, and is never hashed or pickled.
+    Gateway errors (typically a backend cold start) and failed connects are
+    retried with exponential backoff for GET and POST alike; after the last
+    attempt the final response is returned rather than raised, so callers see
+    its status. Read errors are never retried: the request already reached the
+    backend, and resending a chat or translation would pay for it again.
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        read=False,
+        backoff_factor=0.3,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset(["GET", "POST"]),
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+@st.cache_resource(show_spinner=False)
+def get_pool():
+    """Shared worker thread pool for blocking API calls"""
+    return ThreadPoolExecutor(max_workers=4)
+
+# Known column types for keyword result rows, covering both the raw table
+# columns and the aliases used by the /keywords/top endpoint
+KEYWORD_DTYPES = {
+    "SEARCH_QUERY": "string",
+    "KEYWORD": "string",
+    "Impressions: Total Count": "int64",
+    "Clicks: Total Count": "int64",
+    "Cart Adds: Total Count": "int64",
+    "Purchases: Total Count": "int64",
+    "IMPRESSIONS": "int64",
+    "CLICKS": "int64",
+    "CART_ADDS": "int64",
+    "PURCHASES": "int64",
+}
+DATE_COLS = ["DATE"]
+
 # Security configuration
 def get_secret(key, default_value):
     """Safely get secret from Streamlit secrets or return default"""
@@ -70,47 +131,338 @@ def login_form():
             else:
                 st.error("Invalid credentials")
 
-def check_api_health():
-    """Check if the API is running and healthy"""
+def _fetch_api_health(session=None):
+    """Query the API health endpoint (uncached)"""
     try:
-        response = requests.get(f"{API_BASE_URL}/health", timeout=10)
-        return response.status_code == 200, response.json()
+        response = (session or get_session()).get(f"{API_BASE_URL}/health", timeout=(CONNECT_TIMEOUT, 10))
+        return response.status_code == 200, orjson.loads(response.content)
     except Exception as e:
         return False, {"error": str(e)}
 
-def translate_to_korean(text):
-    """Translate text to Korean using Claude AI"""
-    try:
-        # Use Claude AI for translation
-        response = requests.post(
-            f"{API_BASE_URL}/translate",
-            json={"text": text, "target_language": "Korean"},
-            timeout=30
-        )
-        if response.status_code == 200:
-            return response.json().get("translation", text)
-        else:
-            return text  # Return original text if translation fails
-    except Exception as e:
-        st.warning(f"Translation failed: {str(e)}")
-        return text
+def _post_json(path, payload, headers=None, session=None, **kwargs):
+    """POST an orjson-serialized payload to the API"""
+    return (session or get_session()).post(
+        f"{API_BASE_URL}{path}",
+        data=orjson.dumps(payload),
+        headers={"Content-Type": "application/json", **(headers or {})},
+        **kwargs
+    )
+
+def _request_translation(text, session=None):
+    """Fetch a Korean translation, raising on HTTP or backend errors.
+
+    Makes no Streamlit calls, so it is safe to run on a pool thread when
+    given a session resolved on the script thread.
+    """
+    response = _post_json(
+        "/translate",
+        {"text": text, "target_language": "Korean"},
+        session=session,
+        timeout=(CONNECT_TIMEOUT, 30)
+    )
+    response.raise_for_status()
+    result = orjson.loads(response.content)
+    if result.get("error"):
+        raise RuntimeError(result["error"])
+    return result.get("translation", text)
+
+def _text_key(text):
+    """Stable short key for a piece of text"""
+    return hashlib.blake2b(text.encode(), digest_size=8).hexdigest()
+
+@st.cache_resource(show_spinner=False)
+def get_translation_store():
+    """Process-wide Korean translations keyed on _text_key of the source text.
+
+    Shared by every session and kept across reloads. Only touched from the
+    script thread; translation workers hand results back through futures.
+    """
+    return OrderedDict()
+
+def remember_translation(text, translation):
+    """Store a successful translation, evicting the oldest past the size limit"""
+    store = get_translation_store()
+    store[_text_key(text)] = translation
+    while len(store) > TRANSLATION_STORE_SIZE:
+        try:
+            store.popitem(last=False)
+        except KeyError:
+            break
+
+def _iter_sse_events(response):
+    """Yield decoded JSON payloads from the data frames of an SSE response"""
+    for line in response.iter_lines(decode_unicode=True):
+        if line and line.startswith("data:"):
+            yield orjson.loads(line[len("data:"):].strip())
+
+def _post_chat(payload, timeout):
+    """Open a streaming POST to the chat endpoint"""
+    return _post_json(
+        "/chat",
+        payload,
+        headers={"Accept": "text/event-stream"},
+        stream=True,
+        timeout=timeout
+    )
+
+def _send_simple(message):
+    """Open a simple mode chat request"""
+    return _post_chat({"message": message, "mode": "simple"}, (CONNECT_TIMEOUT, 30))
+
+def _send_research(message):
+    """Open a research mode chat request.
 
-def send_chat_message_with_mode(message, mode="research"):
-    """Send a message to the chat API with specified mode"""
+    The read timeout bounds the gap between streamed frames, and research
+    answers can sit on a long Claude call between stages.
+    """
+    return _post_chat({"message": message, "mode": "research"}, (CONNECT_TIMEOUT, 120))
+
+def _read_chat_response(response, on_event=None):
+    """Consume a chat response, forwarding stream events to ``on_event``"""
+    if response.status_code != 200:
+        return False, {"error": f"API returned HTTP {response.status_code}"}
+    
+    # Older backends ignore the Accept header and answer with plain JSON
+    if not response.headers.get("content-type", "").startswith("text/event-stream"):
+        return True, orjson.loads(response.content)
+    
+    for event in _iter_sse_events(response):
+        if event.get("type") == "done":
+            event.pop("type")
+            return True, event
+        if on_event:
+            on_event(event)
+    return False, {"error": "The response stream ended unexpectedly. Please try again."}
+
+def send_chat_message_with_mode(message, mode="research", on_event=None):
+    """Send a message to the chat API with specified mode, streaming the reply.
+
+    ``on_event`` is called with every stage/token event as it arrives so the
+    caller can render incrementally; the final response payload is returned.
+    """
+    send = _send_simple if mode == "simple" else _send_research
     try:
-        response = requests.post(
-            f"{API_BASE_URL}/chat",
-            json={"message": message, "mode": mode},
-            timeout=60 if mode == "research" else 30
-        )
-        return response.status_code == 200, response.json()
+        with send(message) as response:
+            return _read_chat_response(response, on_event)
     except requests.exceptions.Timeout:
         return False, {"error": "Request timed out. Please try again."}
     except requests.exceptions.ConnectionError:
         return False, {"error": f"Cannot connect to API server at {API_BASE_URL}"}
-    except Exception as e:
+    except (requests.exceptions.RequestException, ValueError) as e:
+        # Other transport failures (e.g. a stream cut off mid-response) or a malformed payload
         return False, {"error": str(e)}
 
+def init_chat_history():
+    """Initialize chat history as parallel role/content/translation lists"""
+    st.session_state.setdefault("roles", [])
+    st.session_state.setdefault("contents", [])
+    st.session_state.setdefault("korean", [])
+
+def append_message(role, content):
+    """Append a message to the chat history"""
+    st.session_state.roles.append(role)
+    st.session_state.contents.append(content)
+    st.session_state.korean.append(None)
+
+def clear_chat_history():
+    """Remove every message from the chat history"""
+    st.session_state.roles = []
+    st.session_state.contents = []
+    st.session_state.korean = []
+    st.session_state.translate_futs = {}
+    st.session_state.translate_errors = {}
+
+def latest_exchange_start(roles):
+    """Index where the latest user/assistant exchange begins"""
+    for index in range(len(roles) - 1, -1, -1):
+        if roles[index] == "user":
+            return index
+    return 0
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def render_history(n, roles, contents, korean):
+    """Render the first n chat messages as one markdown string"""
+    speakers = {"user": "🧑 **You**", "assistant": "🤖 **Assistant**"}
+    blocks = []
+    for role, content, translation in zip(roles[:n], contents[:n], korean[:n]):
+        block = f"{speakers.get(role, role)}\n\n{content}"
+        if translation:
+            block += f"\n\n🇰🇷 **한국어 번역**\n\n{translation}"
+        blocks.append(block)
+    return "\n\n---\n\n".join(blocks)
+
+def to_df(rows):
+    """Build a DataFrame from API result rows using the known keyword schema.
+
+    Known columns get explicit dtypes instead of per-column inference; a column
+    that doesn't fit its dtype (e.g. it contains nulls or fractional values)
+    keeps the inferred one.
+    """
+    # Imported lazily: most reruns render only chat text and never need pandas
+    import pandas as pd
+    
+    df = pd.DataFrame.from_records(rows)
+    for column, dtype in KEYWORD_DTYPES.items():
+        if column in df.columns:
+            series = df[column]
+            # astype would truncate fractional floats instead of raising
+            if dtype == "int64" and pd.api.types.is_float_dtype(series) and not (series % 1 == 0).all():
+                continue
+            try:
+                df[column] = series.astype(dtype)
+            except (TypeError, ValueError):
+                pass
+    
+    # The API serializes dates as ISO strings; an explicit format skips inference
+    for column in DATE_COLS:
+        if column in df.columns:
+            df[column] = pd.to_datetime(df[column], format="ISO8601", cache=True)
+    return df
+
+def top_k_rows(df, column, k=10):
+    """Rows holding the k largest values of column, in descending order.
+
+    np.argpartition selects the top k in O(n) and only those k get sorted,
+    instead of ranking the whole column. Nulls are always dropped, unlike
+    nlargest on inputs of k rows or fewer, which keeps them.
+    """
+    import numpy as np
+    
+    values = df[column].to_numpy(dtype="float64", na_value=np.nan)
+    candidates = np.flatnonzero(~np.isnan(values))
+    if len(candidates) > k:
+        # argpartition picks arbitrary rows among ties at the k-th value, so keep
+        # everything above it and fill up with the earliest tied rows, as nlargest does
+        candidate_values = values[candidates]
+        threshold = candidate_values[np.argpartition(candidate_values, -k)[-k]]
+        above = candidates[candidate_values > threshold]
+        tied = candidates[candidate_values == threshold][:k - len(above)]
+        candidates = np.sort(np.concatenate([above, tied]))
+    order = candidates[np.argsort(-values[candidates], kind="stable")]
+    return df.iloc[order]
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def build_figs(data_json):
+    """Build the query results DataFrame and its charts from JSON-encoded rows.
+
+    Keyed on the serialized payload, so when an identical result set comes
+    back (e.g. the same question asked again) the pandas coercion and Plotly
+    figure construction are skipped. The rows are decoded from the key itself,
+    so it must be serialized without reordering keys to keep the SQL column
+    order.
+    """
+    import plotly.express as px
+    
+    df = to_df(orjson.loads(data_json))
+    line_fig = bar_fig = None
+    if df.empty:
+        return df, line_fig, bar_fig
+    
+    # Time series if date column exists
+    if 'DATE' in df.columns and 'Impressions: Total Count' in df.columns:
+        line_fig = px.line(df, x='DATE', y='Impressions: Total Count', 
+                           title='Impressions Over Time')
+    
+    # Top performers chart
+    if 'SEARCH_QUERY' in df.columns and 'Purchases: Total Count' in df.columns:
+        top_keywords = top_k_rows(df, 'Purchases: Total Count', 10)
+        bar_fig = px.bar(top_keywords, x='SEARCH_QUERY', y='Purchases: Total Count',
+                         title='Top 10 Keywords by Purchases')
+    
+    return df, line_fig, bar_fig
+
+@st.fragment
+def render_chat_history():
+    """Render the chat history as a fragment.
+
+    Everything before the latest exchange is a single cached markdown block and
+    only the latest exchange gets live chat bubbles. Widgets in here (the
+    translate button) rerun just this fragment instead of the whole app.
+    """
+    collect_translations()
+    roles = st.session_state.roles
+    contents = st.session_state.contents
+    korean = st.session_state.korean
+    
+    tail_start = latest_exchange_start(roles)
+    if tail_start:
+        st.markdown(render_history(
+            tail_start, tuple(roles[:tail_start]), tuple(contents[:tail_start]), tuple(korean[:tail_start])
+        ))
+    for index in range(tail_start, len(roles)):
+        with st.chat_message(roles[index]):
+            st.markdown(contents[index])
+            if roles[index] == "assistant":
+                render_translation(index)
+    
+    # Rendered last so translations started by a click in this run are covered;
+    # once nothing is pending the poller is no longer called and stops
+    if st.session_state.translate_futs:
+        poll_translations(tail_start)
+
+def render_translation(index):
+    """Show the translate button and any Korean translation for an assistant message"""
+    korean = st.session_state.korean
+    if korean[index]:
+        with st.expander("🇰🇷 한국어 번역", expanded=True):
+            st.markdown(korean[index])
+        return
+    
+    pending = st.session_state.setdefault("translate_futs", {})
+    if index in pending:
+        st.info("🇰🇷 Translating to Korean...")
+        return
+    
+    error = st.session_state.setdefault("translate_errors", {}).pop(index, None)
+    if error:
+        st.warning(f"Translation failed: {error}")
+    
+    col1, col2 = st.columns([1, 4])
+    with col1:
+        clicked = st.button(f"🇰🇷 Translate", key=f"translate_{index}")
+    if clicked:
+        text = st.session_state.contents[index]
+        known = get_translation_store().get(_text_key(text))
+        if known:
+            korean[index] = known
+            st.rerun()
+        
+        # Translate on a worker thread so the page stays usable meanwhile.
+        # Streamlit caches can't be used off the script thread, so the worker
+        # gets the session directly and the result is stored once collected.
+        pending[index] = get_pool().submit(_request_translation, text, get_session())
+        st.info("🇰🇷 Translating to Korean...")
+
+def collect_translations():
+    """Move finished background translations into the chat history.
+
+    Covers every pending message, including ones already folded into the
+    cached history block.
+    """
+    pending = st.session_state.setdefault("translate_futs", {})
+    errors = st.session_state.setdefault("translate_errors", {})
+    for index, future in list(pending.items()):
+        if not future.done():
+            continue
+        del pending[index]
+        try:
+            translation = future.result()
+            st.session_state.korean[index] = translation
+            remember_translation(st.session_state.contents[index], translation)
+        except Exception as e:
+            errors[index] = str(e)
+
+@st.fragment(run_every=0.5)
+def poll_translations(tail_start):
+    """Poll every background translation, re-running only this fragment until one finishes"""
+    pending = st.session_state.translate_futs
+    if any(future.done() for future in pending.values()):
+        # The rerun picks the results up in collect_translations
+        st.rerun()
+    if any(index < tail_start for index in pending):
+        # Messages in the cached history block have no indicator of their own
+        st.info("🇰🇷 Translating earlier messages to Korean...")
+
 def main_app():
     """Main application after authentication"""
     # Page configuration
@@ -125,8 +477,10 @@ def main_app():
     st.title("🤖 Amazon Keyword Performance AI Chatbot")
     st.markdown("Ask questions about your Amazon keyword performance data in natural language!")
 
-    # Check API health
-    api_healthy, health_data = check_api_health()
+    # Check API health and prefetch the sidebar data in one round trip
+    metric = st.session_state.get("top_kw_metric", "purchases")
+    limit = 10  # Fixed to 10 results
+    (api_healthy, health_data), _, _ = get_bootstrap_state(metric, limit)
     if not api_healthy:
         st.error(f"⚠️ Cannot connect to API server at {API_BASE_URL}")
         st.info("Please ensure the backend server is running and accessible.")
@@ -157,26 +511,44 @@ def main_app():
         
         # Performance Summary
         if st.button("📈 Get Performance Summary"):
-            success, data = get_performance_summary()
+            if "perf_summary" in st.session_state:
+                # The summary is already showing, so a re-click asks for fresh data
+                _, (success, data), _ = refresh_bootstrap(metric, limit)
+            else:
+                _, (success, data), _ = get_bootstrap_state(metric, limit)
             if success:
                 st.success("✅ Performance data loaded!")
-                st.json(data)
+                st.session_state.perf_summary = data
             else:
                 st.error("❌ Failed to load performance data")
+                st.session_state.pop("perf_summary", None)
+        
+        # Keep showing the last loaded summary across reruns
+        if "perf_summary" in st.session_state:
+            st.json(st.session_state.perf_summary)
         
         # Top Keywords
-        metric = st.selectbox("Top Keywords by:", ["purchases", "clicks", "impressions", "cart_adds"])
+        metric = st.selectbox("Top Keywords by:", ["purchases", "clicks", "impressions", "cart_adds"], key="top_kw_metric")
         
         if st.button(f"🏆 Get Top Keywords"):
-            success, data = get_top_keywords(metric, 10)  # Fixed to 10 results
+            top_kw = st.session_state.get("top_kw")
+            if top_kw and top_kw[:2] == (metric, limit):
+                # The table is already showing, so a re-click asks for fresh data
+                _, _, (success, data) = refresh_bootstrap(metric, limit)
+            else:
+                _, _, (success, data) = get_bootstrap_state(metric, limit)
             if success:
                 st.success(f"✅ Top keywords loaded!")
-                if data.get('results'):
-                    df = pd.DataFrame(data['results'])
-                    st.dataframe(df)
+                df = to_df(data['results']) if data.get('results') else None
+                st.session_state.top_kw = (metric, limit, df)
             else:
                 st.error("❌ Failed to load top keywords")
         
+        # Keep showing the last loaded table across reruns while it matches the selection
+        top_kw = st.session_state.get("top_kw")
+        if top_kw and top_kw[:2] == (metric, limit) and top_kw[2] is not None:
+            st.dataframe(top_kw[2])
+        
         # Logout button
         if ENABLE_AUTH:
             if st.button("🚪 Logout"):
@@ -187,23 +559,24 @@ def main_app():
     st.header("💬 Chat with Your Data")
     
     # Initialize chat history and translation state
-    if "messages" not in st.session_state:
-        st.session_state.messages = []
+    init_chat_history()
+    roles = st.session_state.roles
 
     # Display chat history
-    for message in st.session_state.messages:
-        with st.chat_message(message["role"]):
-            st.markdown(message["content"])
-            
-            # Show Korean translation for assistant messages if available
-            if message["role"] == "assistant" and message.get("korean_translation"):
-                with st.expander("🇰🇷 한국어 번역"):
-                    st.markdown(message["korean_translation"])
+    render_chat_history()
 
     # Chat input
     if prompt := st.chat_input("Ask about your keyword performance..."):
+        # Drop back-to-back duplicate submissions of the same prompt
+        prompt_hash = hashlib.blake2b(prompt.encode(), digest_size=8).digest()
+        now = time.monotonic()
+        if st.session_state.get("last_prompt_hash") == prompt_hash and now - st.session_state.get("last_prompt_ts", 0) < DUPLICATE_PROMPT_WINDOW:
+            st.stop()
+        st.session_state.last_prompt_hash = prompt_hash
+        st.session_state.last_prompt_ts = now
+        
         # Add user message to chat history
-        st.session_state.messages.append({"role": "user", "content": prompt})
+        append_message("user", prompt)
         with st.chat_message("user"):
             st.markdown(prompt)
 
@@ -211,49 +584,34 @@ def main_app():
         with st.chat_message("assistant"):
             mode = "simple" if response_mode == "Simple Mode" else "research"
             
-            if mode == "research":
-                # Research mode with progress indicators
-                progress_bar = st.progress(0)
-                status_text = st.empty()
-                
-                # Progress stages for research mode
-                stages = [
-                    "🔍 Analyzing your question...",
-                    "📊 Querying the database...",
-                    "🤖 Generating AI insights...",
-                    "📈 Creating visualizations...",
-                    "✅ Finalizing response..."
-                ]
-                
-                for i, stage in enumerate(stages):
-                    progress_bar.progress((i + 1) / len(stages))
-                    status_text.text(stage)
-                    time.sleep(0.5)  # Simulate processing time
-                
-                status_text.text("✅ Analysis complete!")
-                time.sleep(0.5)
-                
-                # Clear progress indicators
-                progress_bar.empty()
-                status_text.empty()
+            # Research mode reports the backend's real pipeline stages; the
+            # panel keeps a timeline of when each one started
+            status = st.status("🔬 Researching your question...", expanded=False) if mode == "research" else None
+            response_placeholder = st.empty()
+            streamed_text = []
+            started = time.monotonic()
+            
+            def on_event(event):
+                if event.get("type") == "stage" and status is not None:
+                    status.update(label=event["label"])
+                    status.write(f"{event['label']} ({time.monotonic() - started:.1f}s)")
+                elif event.get("type") == "token":
+                    streamed_text.append(event["text"])
+                    response_placeholder.markdown("".join(streamed_text) + "▌")  # Add cursor effect
             
             # Get response from API with streaming
-            success, response = send_chat_message_with_mode(prompt, mode)
+            success, response = send_chat_message_with_mode(prompt, mode, on_event=on_event)
+            
+            if status is not None:
+                elapsed = time.monotonic() - started
+                status.update(
+                    label=f"✅ Analysis complete! ({elapsed:.1f}s)" if success else "❌ Analysis failed",
+                    state="complete" if success else "error"
+                )
             
             if success:
-                # Display response with real-time streaming effect
                 response_text = response.get("response", "No response received")
                 
-                # Create a placeholder for streaming effect
-                response_placeholder = st.empty()
-                
-                # Simulate streaming effect by showing text character by character
-                displayed_text = ""
-                for char in response_text:
-                    displayed_text += char
-                    response_placeholder.markdown(displayed_text + "▌")  # Add cursor effect
-                    time.sleep(0.01)  # Adjust speed as needed
-                
                 # Final display without cursor
                 response_placeholder.markdown(response_text)
                 
@@ -265,26 +623,16 @@ def main_app():
                 # Display data if available
                 if response.get("data"):
                     with st.expander("📊 Query Results"):
-                        df = pd.DataFrame(response["data"])
+                        df, line_fig, bar_fig = build_figs(orjson.dumps(response["data"]))
                         st.dataframe(df)
                         
                         # Create visualizations
-                        if not df.empty:
+                        if line_fig is not None or bar_fig is not None:
                             st.subheader("📈 Visualizations")
-                            
-                            # Time series if date column exists
-                            if 'DATE' in df.columns:
-                                df['DATE'] = pd.to_datetime(df['DATE'])
-                                fig = px.line(df, x='DATE', y='Impressions: Total Count', 
-                                             title='Impressions Over Time')
-                                st.plotly_chart(fig)
-                            
-                            # Top performers chart
-                            if 'SEARCH_QUERY' in df.columns and 'Purchases: Total Count' in df.columns:
-                                top_keywords = df.nlargest(10, 'Purchases: Total Count')
-                                fig = px.bar(top_keywords, x='SEARCH_QUERY', y='Purchases: Total Count',
-                                            title='Top 10 Keywords by Purchases')
-                                st.plotly_chart(fig)
+                            if line_fig is not None:
+                                st.plotly_chart(line_fig)
+                            if bar_fig is not None:
+                                st.plotly_chart(bar_fig)
                 
                 # Display insights if available
                 if response.get("insights"):
@@ -292,62 +640,114 @@ def main_app():
                         st.markdown(response["insights"])
                 
                 # Add assistant response to chat history with translation button
-                message_key = f"msg_{len(st.session_state.messages)}"
-                st.session_state.messages.append({
-                    "role": "assistant", 
-                    "content": response_text,
-                    "message_key": message_key
-                })
-                
-                # Add translation button for this specific message
-                col1, col2 = st.columns([1, 4])
-                with col1:
-                    if st.button(f"🇰🇷 Translate", key=f"translate_{message_key}"):
-                        with st.spinner("Translating to Korean..."):
-                            korean_text = translate_to_korean(response_text)
-                            # Update the specific message with translation
-                            for msg in st.session_state.messages:
-                                if msg.get("message_key") == message_key:
-                                    msg["korean_translation"] = korean_text
-                                    break
-                            st.rerun()
-                
-                # Display Korean translation if available for this message
-                for msg in st.session_state.messages:
-                    if msg.get("message_key") == message_key and msg.get("korean_translation"):
-                        with st.expander("🇰🇷 한국어 번역", expanded=True):
-                            st.markdown(msg["korean_translation"])
-                        break
+                append_message("assistant", response_text)
+                render_translation(len(roles) - 1)
                 
             else:
+                response_placeholder.empty()
                 error_msg = response.get("error", "Unknown error occurred")
                 st.error(f"❌ Error: {error_msg}")
-                st.session_state.messages.append({"role": "assistant", "content": f"Sorry, I encountered an error: {error_msg}"})
+                append_message("assistant", f"Sorry, I encountered an error: {error_msg}")
 
     # Clear chat button
     if st.button("🗑️ Clear Chat History"):
-        st.session_state.messages = []
+        clear_chat_history()
         st.rerun()
 
 def send_chat_message(message):
     """Send a message to the chat API (legacy function for compatibility)"""
     return send_chat_message_with_mode(message, "research")
 
-def get_performance_summary():
-    """Get performance summary from API"""
+def _fetch_performance_summary(session=None):
+    """Query the API summary endpoint (uncached)"""
     try:
-        response = requests.get(f"{API_BASE_URL}/summary", timeout=10)
-        return response.status_code == 200, response.json()
-    except:
+        response = (session or get_session()).get(f"{API_BASE_URL}/summary", timeout=(CONNECT_TIMEOUT, 10))
+    except requests.exceptions.RequestException:
         return False, {}
+    if response.status_code != 200:
+        return False, {}
+    return True, orjson.loads(response.content)
 
-def get_top_keywords(metric="purchases", limit=10):
-    """Get top keywords by metric"""
+def _fetch_top_keywords(metric="purchases", limit=10, session=None):
+    """Query the API top keywords endpoint (uncached)"""
     try:
-        response = requests.get(f"{API_BASE_URL}/keywords/top/{metric}?limit={limit}", timeout=10)
-        return response.status_code == 200, response.json()
-    except:
+        response = (session or get_session()).get(f"{API_BASE_URL}/keywords/top/{metric}?limit={limit}", timeout=(CONNECT_TIMEOUT, 10))
+    except requests.exceptions.RequestException:
+        return False, {}
+    if response.status_code != 200:
         return False, {}
+    return True, orjson.loads(response.content)
+
+def _bootstrap_parallel(metric, limit):
+    """Bootstrap against backends without /bootstrap by fetching concurrently.
+
+    The calls are plain blocking requests, so running them on pool threads makes
+    the sidebar wait for the slowest one rather than their sum.
+    """
+    # Resolve cached resources here: Streamlit caches can't be used off the script thread
+    pool = get_pool()
+    session = get_session()
+    health = pool.submit(_fetch_api_health, session)
+    summary = pool.submit(_fetch_performance_summary, session)
+    top_keywords = pool.submit(_fetch_top_keywords, metric, limit, session)
+    return health.result(), summary.result(), top_keywords.result()
+
+@st.cache_data(ttl=30, show_spinner=False)
+def bootstrap(metric="purchases", limit=10):
+    """Fetch API health, performance summary and top keywords in one request.
+
+    Returns ``(health, summary, top_keywords)``, each a ``(success, data)`` pair.
+    """
+    try:
+        response = get_session().get(
+            f"{API_BASE_URL}/bootstrap",
+            params={"metric": metric, "limit": limit},
+            timeout=(CONNECT_TIMEOUT, 10)
+        )
+        if response.status_code == 404:
+            return _bootstrap_parallel(metric, limit)
+        data = orjson.loads(response.content)
+    except Exception as e:
+        return (False, {"error": str(e)}), (False, {}), (False, {})
+    
+    if response.status_code != 200:
+        return (False, data), (False, {}), (False, {})
+    
+    summary = data.get("summary")
+    top_keywords = data.get("top_keywords")
+    return (
+        (True, data.get("health", {})),
+        (summary is not None, summary or {}),
+        (top_keywords is not None, top_keywords or {})
+    )
+
+def get_bootstrap_state(metric="purchases", limit=10):
+    """Return bootstrap() results, re-checking at most every HEALTH_CHECK_INTERVAL.
+
+    Chat input and button clicks rerun the whole script; within the interval
+    those reruns reuse this session's last healthy result without calling out.
+    """
+    now = time.monotonic()
+    cached = st.session_state.get("bootstrap")
+    if cached and cached[0] == (metric, limit) and now - st.session_state.get("bootstrap_ts", 0) <= HEALTH_CHECK_INTERVAL:
+        return cached[1]
+    
+    state = bootstrap(metric, limit)
+    (api_healthy, _), _, _ = state
+    if api_healthy:
+        st.session_state.bootstrap = ((metric, limit), state)
+        st.session_state.bootstrap_ts = now
+    else:
+        # Don't keep serving a cached outage
+        bootstrap.clear(metric, limit)
+        st.session_state.pop("bootstrap", None)
+    return state
+
+def refresh_bootstrap(metric="purchases", limit=10):
+    """Drop cached bootstrap data and fetch it again"""
+    bootstrap.clear(metric, limit)
+    st.session_state.pop("bootstrap", None)
+    return get_bootstrap_state(metric, limit)
 
 # Main application flow
 if __name__ == "__main__":